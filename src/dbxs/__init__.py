@@ -3,11 +3,13 @@ DBXS (“D.B. Access”) is an SQL database access layer for Python.
 """
 
 from ._access import (
+    ITERABLE_KEY,
     ExtraneousMethods,
     IncorrectResultCount,
     NotEnoughResults,
     ParamMismatch,
     TooManyResults,
+    WrongRowShape,
     accessor,
     many,
     maybe,
@@ -34,4 +36,6 @@ __all__ = [
     "NotEnoughResults",
     "IncorrectResultCount",
     "ExtraneousMethods",
+    "WrongRowShape",
+    "ITERABLE_KEY",
 ]
@@ -3,19 +3,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from inspect import (
-    BoundArguments,
+    Parameter,
+    Signature,
     currentframe,
     getsourcefile,
     getsourcelines,
-    isawaitable,
+    isasyncgenfunction,
     signature,
 )
-from types import FrameType, TracebackType
+from linecache import getline
 from typing import (
     Any,
     AsyncIterable,
+    AsyncIterator,
     Awaitable,
     Callable,
+    ClassVar,
     Coroutine,
     Dict,
     Iterable,
@@ -24,9 +27,11 @@ from typing import (
     Optional,
     Sequence,
     Tuple,
+    Type,
     TypeVar,
     Union,
 )
+from weakref import WeakKeyDictionary
 
 from ._typing_compat import ParamSpec, Protocol
 from .async_dbapi import AsyncConnection, AsyncCursor
@@ -76,25 +81,53 @@ class WrongRowShape(TypeError):
     """
 
 
+def _describeLocation(filename: str, lineno: int) -> str:
+    """
+    Describe a line of source code by its location and, if available, its
+    text.
+    """
+    text = getline(filename, lineno).strip()
+    return f"{filename}:{lineno}" + (f": {text}" if text else "")
+
+
 @dataclass
 class _ExceptionFixer:
+    """
+    Re-raise errors from a loader as L{WrongRowShape}, with a message pointing
+    at where the loader was defined and where it was decorated.
+
+    Only the decoration site is recorded when the fixer is created; finding
+    the definition requires reading source code, so it is deferred until an
+    error actually needs to be reported.
+    """
+
     loader: Callable[..., object]
-    definitionLine: int
+    decorationFile: str
     decorationLine: int
-    decorationFrame: FrameType
-    definitionFrame: FrameType
 
     def reraise(self, row: object, e: Exception) -> NoReturn:
-        withDecorationAdded = TracebackType(
-            None, self.decorationFrame, 0, self.decorationLine
+        try:
+            _, definitionLine = getsourcelines(self.loader)
+            definedSourceFile = getsourcefile(self.loader)
+        except (OSError, TypeError):
+            definitionLine, definedSourceFile = 0, None
+        definedHere = _describeLocation(
+            definedSourceFile or "unknown definition", definitionLine
+        )
+        decoratedHere = _describeLocation(
+            self.decorationFile, self.decorationLine
         )
-        withDefinitionAdded = TracebackType(
-            withDecorationAdded, self.definitionFrame, 0, self.definitionLine
+        qualname = getattr(self.loader, "__qualname__", None)
+        loaderName = (
+            f"{self.loader.__module__}.{qualname}"
+            if qualname
+            else repr(self.loader)
         )
         raise WrongRowShape(
-            f"loader {self.loader.__module__}.{self.loader.__name__}"
-            f" could not handle {row}"
-        ).with_traceback(withDefinitionAdded) from e
+            f"loader {loaderName} could not handle {row}\n"
+            f"  defined at {definedHere}\n"
+            f"  decorated at {decoratedHere}"
+        ) from e
 
     @classmethod
     def create(cls, loader: Callable[..., T]) -> _ExceptionFixer:
@@ -104,45 +137,19 @@ class _ExceptionFixer:
         assert frameworkFrame is not None
         realDecorationFrame = frameworkFrame.f_back
         assert realDecorationFrame is not None
-        wholeSource, definitionLine = getsourcelines(loader)
-
-        # coverage is tricked by the __code__ modifications below, so we have
-        # to explicitly ignore the gap
-
-        def decoratedHere() -> FrameType | None:
-            return currentframe()  # pragma: no cover
-
-        def definedHere() -> FrameType | None:
-            return currentframe()  # pragma: no cover
-
-        decoratedHere.__code__ = decoratedHere.__code__.replace(
-            co_name="<<decorated here>>",
-            co_filename=realDecorationFrame.f_code.co_filename,
-            co_firstlineno=realDecorationFrame.f_lineno,
-        )
-
-        definedSourceFile = getsourcefile(loader)
-        definedHere.__code__ = definedHere.__code__.replace(
-            co_name="<<defined here>>",
-            co_filename=definedSourceFile or "unknown definition",
-            co_firstlineno=definitionLine,
-        )
-
-        fakeDecorationFrame = decoratedHere()
-        definitionFrame = definedHere()
-        assert realDecorationFrame is not None
-        assert definitionFrame is not None
-        assert fakeDecorationFrame is not None
-
         return cls(
             loader=loader,
-            definitionFrame=definitionFrame,
-            definitionLine=definitionLine,
-            decorationFrame=fakeDecorationFrame,
+            decorationFile=realDecorationFrame.f_code.co_filename,
             decorationLine=realDecorationFrame.f_lineno,
         )
 
 
+ITERABLE_KEY = "__query_iterable__"
+"""
+Attribute set to C{True} on translators, like the ones returned by L{many},
+whose result must be iterated rather than awaited.
+"""
+
 _NR = TypeVar("_NR")
 
 
@@ -152,7 +159,9 @@ def _makeTranslator(
     noResults: Callable[[], _NR],
 ) -> Callable[[object, AsyncCursor], Coroutine[object, object, T | _NR]]:
     async def translator(db: object, cursor: AsyncCursor) -> T | _NR:
-        rows = await cursor.fetchall()
+        # Two rows are enough to tell that there are too many, without
+        # loading an arbitrarily large result set.
+        rows = await cursor.fetchmany(2)
         if len(rows) < 1:
             return noResults()
         if len(rows) > 1:
@@ -196,10 +205,14 @@ def maybe(
 
 
 def many(
-    load: Callable[..., T]
+    load: Callable[..., T],
+    chunkSize: int = 128,
 ) -> Callable[[object, AsyncCursor], AsyncIterable[T]]:
     """
     Fetch multiple results with a function to translate rows.
+
+    @param chunkSize: The number of rows to request from the cursor at once,
+        with C{fetchmany}.
     """
     fixer = _ExceptionFixer.create(load)
 
@@ -207,14 +220,16 @@ def many(
         db: object, cursor: AsyncCursor
     ) -> AsyncIterable[T]:
         while True:
-            row = await cursor.fetchone()
-            if row is None:
+            rows = await cursor.fetchmany(chunkSize)
+            if not rows:
                 return
-            try:
-                yield load(db, *row)
-            except TypeError as e:
-                fixer.reraise(row, e)
+            for row in rows:
+                try:
+                    yield load(db, *row)
+                except TypeError as e:
+                    fixer.reraise(row, e)
 
+    setattr(translateMany, ITERABLE_KEY, True)
     return translateMany
 
 
@@ -222,6 +237,10 @@ async def zero(loader: object, cursor: AsyncCursor) -> None:
     """
     Zero record loader.
     """
+    if await cursor.description() is None:
+        # There is no result set at all, as for most DML statements; some
+        # drivers raise an error if asked to fetch from one, so don't.
+        return None
     result = await cursor.fetchone()
     if result is not None:
         raise TooManyResults("statemnts should not return values")
@@ -231,21 +250,64 @@ async def zero(loader: object, cursor: AsyncCursor) -> None:
 METADATA_KEY = "__query_metadata__"
 
 
+_RESERVED_NAMES = frozenset(["_dbxs_run", "_dbxs_defaults"])
+"""
+Names that the code generated by L{_specializeProxyMethod} uses for its own
+purposes, and so cannot be used as query parameters.
+"""
+
+
 @dataclass
-class MaybeAIterable:
-    down: Any
-    cursor: AsyncCursor = field(init=False)
+class _DefaultReference:
+    """
+    Stand-in for a parameter's default value while rendering a signature as
+    source code; its C{repr} is an expression that looks the real default up
+    in the namespace of the generated function.
+    """
 
-    def __await__(self) -> Any:
-        return self.down.__await__()
+    name: str
 
-    async def __aiter__(self) -> Any:
-        try:
-            actuallyiter = await self
-            async for each in actuallyiter:
-                yield each
-        finally:
-            await self.cursor.close()
+    def __repr__(self) -> str:
+        return f"_dbxs_defaults[{self.name!r}]"
+
+
+def _specializeProxyMethod(
+    protocolMethod: Any,
+    sig: Signature,
+    placeholderNames: Sequence[str],
+    run: Callable[[AccessProxy, Tuple[object, ...]], object],
+) -> Callable[..., object]:
+    """
+    Generate a method with the same signature as C{protocolMethod} that calls
+    C{run} with the proxy and a tuple of its arguments in the order that the
+    SQL's placeholders require them, so that Python's own argument binding
+    replaces any per-call signature inspection.
+    """
+    defaults = {}
+    parameters = []
+    for each in sig.parameters.values():
+        if each.default is not Parameter.empty:
+            defaults[each.name] = each.default
+            each = each.replace(default=_DefaultReference(each.name))
+        parameters.append(each.replace(annotation=Parameter.empty))
+    selfName = parameters[0].name
+    parameterSource = sig.replace(
+        parameters=parameters, return_annotation=Signature.empty
+    )
+    argumentSource = "".join(f"{name}, " for name in placeholderNames)
+    source = (
+        f"def proxyMethod{parameterSource}:\n"
+        f"    return _dbxs_run({selfName}, ({argumentSource}))\n"
+    )
+    namespace: Dict[str, Any] = {"_dbxs_run": run, "_dbxs_defaults": defaults}
+    filename = f"<query {protocolMethod.__qualname__}>"
+    exec(compile(source, filename, "exec"), namespace)
+    proxyMethod: Callable[..., object] = namespace["proxyMethod"]
+    proxyMethod.__name__ = protocolMethod.__name__
+    proxyMethod.__qualname__ = protocolMethod.__qualname__
+    proxyMethod.__module__ = protocolMethod.__module__
+    proxyMethod.__doc__ = protocolMethod.__doc__
+    return proxyMethod
 
 
 @dataclass
@@ -256,71 +318,86 @@ class QueryMetadata:
 
     sql: str
     load: Callable[[AccessProxy, AsyncCursor], A]
-    proxyMethod: Callable[..., Awaitable[object]] = field(init=False)
+    proxyMethods: Dict[str, Callable[..., object]] = field(init=False)
 
     def setOn(self, protocolMethod: Any) -> None:
         """
         Attach this QueryMetadata to the given protocol method definition,
-        checking its arguments and computing C{proxyMethod} in the process,
-        raising L{ParamMismatch} if the expected parameters do not match.
+        checking its arguments and computing C{proxyMethods}, one for each
+        paramstyle, in the process, raising L{ParamMismatch} if the expected
+        parameters do not match.
         """
         sig = signature(protocolMethod)
-        precomputedSQL: Dict[str, Tuple[str, NameMapMapping]] = {}
-        for style, mapFactory in styles.items():
-            mapInstance = mapFactory()
-            styledSQL = self.sql.format_map(mapInstance)
-            precomputedSQL[style] = (styledSQL, mapInstance)
+        reserved = sorted(_RESERVED_NAMES.intersection(sig.parameters))
+        if reserved:
+            raise ParamMismatch(
+                f"when defining {protocolMethod.__name__}(...), "
+                f"parameter names {reserved} are reserved"
+            )
+        styledSQLs: Dict[str, str] = {}
+        placeholderNames: List[str] = []
+        for style, placeholder in styles:
+            mapInstance = IndexCountingParamstyleMap(placeholder)
+            styledSQLs[style] = self.sql.format_map(mapInstance)
+            if style == "qmark":
+                placeholderNames = mapInstance.names
 
-        sampleSQL, sampleInstance = precomputedSQL["qmark"]
         selfExcluded = list(sig.parameters)[1:]
-        if set(sampleInstance.names) != set(selfExcluded):
+        if set(placeholderNames) != set(selfExcluded):
             raise ParamMismatch(
                 f"when defining {protocolMethod.__name__}(...), "
-                f"SQL placeholders {sampleInstance.names} != "
+                f"SQL placeholders {placeholderNames} != "
                 f"function params {selfExcluded}"
             )
+        iterable = getattr(self.load, ITERABLE_KEY, False) or (
+            isasyncgenfunction(self.load)
+        )
+        self.proxyMethods = {
+            style: _specializeProxyMethod(
+                protocolMethod,
+                sig,
+                placeholderNames,
+                self._runner(styledSQL, iterable),
+            )
+            for style, styledSQL in styledSQLs.items()
+        }
+        setattr(protocolMethod, METADATA_KEY, self)
 
-        def proxyMethod(
-            proxySelf: AccessProxy, *args: object, **kw: object
-        ) -> Any:
-            """
-            Implementation of all database-proxy methods on objects returned
-            from C{accessor}.
-
-            @note: This should really be two separate methods.  From
-                annotations we should know whether to use the aiterable path or
-                the awaitable path, we should not need to do the runtime check
-                every time.
-            """
-
-            maybeai: MaybeAIterable
-
-            async def body() -> Any:
-                conn = proxySelf.__query_connection__
-                styledSQL, styledMap = precomputedSQL[conn.paramstyle]
-                cur = await conn.cursor()
-                bound = sig.bind(None, *args, **kw)
-                bound.apply_defaults()
-                await cur.execute(styledSQL, styledMap.queryArguments(bound))
-                maybeAgen: Any = self.load(proxySelf, cur)
-                if isawaitable(maybeAgen):
-                    # if it's awaitable, then it's not an aiterable.
-                    result = await maybeAgen
+    def _runner(
+        self, styledSQL: str, iterable: bool
+    ) -> Callable[[AccessProxy, Tuple[object, ...]], object]:
+        """
+        Create a function that executes C{styledSQL} with a tuple of arguments
+        on a new cursor and loads its results, as an async iterable if
+        C{iterable} is true, or as an awaitable otherwise.
+        """
+        if iterable:
+
+            async def runIterable(
+                proxySelf: AccessProxy, arguments: Tuple[object, ...]
+            ) -> AsyncIterator[object]:
+                cur = await proxySelf.__query_connection__.cursor()
+                try:
+                    await cur.execute(styledSQL, arguments)
+                    rows: Any = self.load(proxySelf, cur)
+                    async for each in rows:
+                        yield each
+                finally:
                     await cur.close()
-                    return result
-                else:
-                    # if it's aiterable, we should be iterating it, not
-                    # awaiting it.  MaybeAIterable takes care of the implicit
-                    # await of _this_ coroutine.
-                    nonlocal maybeai
-                    maybeai.cursor = cur
-                    return maybeAgen
-
-            maybeai = MaybeAIterable(body())
-            return maybeai
-
-        self.proxyMethod = proxyMethod
-        setattr(protocolMethod, METADATA_KEY, self)
+
+            return runIterable
+
+        async def run(
+            proxySelf: AccessProxy, arguments: Tuple[object, ...]
+        ) -> Any:
+            cur = await proxySelf.__query_connection__.cursor()
+            try:
+                await cur.execute(styledSQL, arguments)
+                return await self.load(proxySelf, cur)
+            finally:
+                await cur.close()
+
+        return run
 
     @classmethod
     def loadFrom(cls, f: object) -> Optional[QueryMetadata]:
@@ -358,6 +435,15 @@ def query(
 ) -> Callable[[Callable[P, A]], Callable[P, A]]:
     """
     Declare a query method.
+
+    @param load: A translator like L{one}, L{maybe} or L{many}.  If C{load} is
+        an async generator function, or has an attribute named by
+        L{dbxs.ITERABLE_KEY} set to C{True} (as the translators from L{many}
+        do, even when wrapped with L{functools.wraps}), the declared method
+        returns an async iterable of its results, which must be iterated with
+        C{async for} rather than awaited.  Otherwise, it returns an awaitable
+        of whatever C{load} produces; so a plain function that returns an
+        async iterable must set L{dbxs.ITERABLE_KEY} on itself.
     """
     qm = QueryMetadata(sql=sql, load=load)
 
@@ -400,12 +486,6 @@ class IndexCountingParamstyleMap:
         self.names.append(name)
         return self.placeholder
 
-    def queryArguments(self, bound: BoundArguments) -> Sequence[object]:
-        """
-        Compute the arguments to the query.
-        """
-        return [bound.arguments[each] for each in self.names]
-
 
 class _EmptyProtocol(Protocol):
     """
@@ -417,29 +497,48 @@ class _EmptyProtocol(Protocol):
 PROTOCOL_IGNORED_ATTRIBUTES = set(_EmptyProtocol.__dict__.keys())
 
 
-class NameMapMapping(Protocol):
-    names: List[str]
-
-    def __getitem__(self, __key: str) -> Any:
-        ...
-
-    def queryArguments(self, bound: BoundArguments) -> Sequence[object]:
-        ...
-
-
-styles: dict[str, Callable[[], NameMapMapping]] = {
-    "qmark": lambda: IndexCountingParamstyleMap("?"),
-    "pyformat": lambda: IndexCountingParamstyleMap("%s"),
-}
+styles: Tuple[Tuple[str, str], ...] = (
+    ("qmark", "?"),
+    ("pyformat", "%s"),
+)
 
 
-@dataclass
 class AccessProxy:
     """
     Superclass of all access proxies.
+
+    This is not a dataclass, so that it, and the accessor classes generated
+    from it, can use C{__slots__}; one is created for every transaction.
+
+    @cvar __query_styles__: Subclasses of an accessor class whose query
+        methods have SQL for a particular paramstyle built in, keyed by that
+        paramstyle.  Constructing an accessor looks up the paramstyle of its
+        connection once and makes an instance of the matching subclass.
     """
 
+    __slots__ = ("__query_connection__", "__weakref__")
+
     __query_connection__: AsyncConnection
+    __query_styles__: ClassVar[Dict[str, Type[AccessProxy]]]
+
+    def __new__(cls, __query_connection__: AsyncConnection) -> AccessProxy:
+        return object.__new__(
+            cls.__query_styles__[__query_connection__.paramstyle]
+        )
+
+    def __init__(self, __query_connection__: AsyncConnection) -> None:
+        self.__query_connection__ = __query_connection__
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"__query_connection__={self.__query_connection__!r})"
+        )
+
+
+_accessorClasses: WeakKeyDictionary[
+    Callable[[], object], Callable[[AsyncConnection], Any]
+] = WeakKeyDictionary()
 
 
 def accessor(
@@ -448,14 +547,32 @@ def accessor(
     """
     Create a factory which binds a database transaction in the form of an
     AsyncConnection to a set of declared SQL methods.
+
+    The factory for a given protocol is only created once, so it is cheap to
+    call L{accessor} repeatedly with the same protocol.
     """
-    return type(
-        f"_{accessPatternProtocol.__name__}_Accessor",
+    existing = _accessorClasses.get(accessPatternProtocol)
+    if existing is not None:
+        return existing
+    metadatas = list(
+        QueryMetadata.filterProtocolNamespace(
+            accessPatternProtocol.__dict__.items()
+        )
+    )
+    className = f"_{accessPatternProtocol.__name__}_Accessor"
+    styledClasses: Dict[str, Type[AccessProxy]] = {}
+    accessorClass = type(
+        className,
         tuple([AccessProxy]),
-        {
-            name: metadata.proxyMethod
-            for name, metadata in QueryMetadata.filterProtocolNamespace(
-                accessPatternProtocol.__dict__.items()
-            )
-        },
+        {"__slots__": (), "__query_styles__": styledClasses},
     )
+    for style, _ in styles:
+        namespace: Dict[str, object] = {
+            name: metadata.proxyMethods[style] for name, metadata in metadatas
+        }
+        namespace["__slots__"] = ()
+        styledClasses[style] = type(
+            className, tuple([accessorClass]), namespace
+        )
+    _accessorClasses[accessPatternProtocol] = accessorClass
+    return accessorClass
@@ -67,8 +67,8 @@ class DBAPICursor(Protocol):
     def fetchone(self) -> Optional[Sequence[Any]]:
         ...
 
-    # def fetchmany(self, __size: int = ...) -> Sequence[Sequence[Any]]:
-    #     ...
+    def fetchmany(self, __size: int = ...) -> Sequence[Sequence[Any]]:
+        ...
 
     def fetchall(self) -> Sequence[Sequence[Any]]:
         ...
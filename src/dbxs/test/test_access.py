@@ -1,15 +1,31 @@
 from __future__ import annotations
 
 import traceback
-from dataclasses import dataclass
-from typing import AsyncIterable, Optional
+from dataclasses import dataclass, field
+from functools import partial, wraps
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 from unittest import TestCase
+from weakref import ref
 
 from .. import (
+    ITERABLE_KEY,
     ExtraneousMethods,
     NotEnoughResults,
     ParamMismatch,
     TooManyResults,
+    WrongRowShape,
     accessor,
     many,
     maybe,
@@ -19,12 +35,15 @@ from .. import (
     statement,
 )
 from .._typing_compat import Protocol
-from ..async_dbapi import AsyncConnection, transaction
+from ..async_dbapi import AsyncConnection, AsyncCursor, transaction
+from ..dbapi import DBAPIColumnDescription
 from ..testing import MemoryPool, immediateTest
 
 
 # Trying to stick to the public API for what we're testing; no underscores here.
 
+T = TypeVar("T")
+
 
 @dataclass
 class Foo:
@@ -66,6 +85,13 @@ class FooAccessPattern(Protocol):
     def allFoos(self) -> AsyncIterable[Foo]:
         ...
 
+    @query(
+        sql="select bar, baz from foo order by bar asc",
+        load=many(Foo, chunkSize=1),
+    )
+    def allFoosOneAtATime(self) -> AsyncIterable[Foo]:
+        ...
+
     @query(sql="select bar, baz from foo where bar = {bar}", load=maybe(Foo))
     async def maybeFoo(self, bar: int) -> Optional[Foo]:
         ...
@@ -120,6 +146,53 @@ class FooAccessPattern(Protocol):
         """
 
 
+def wrapped(
+    translator: Callable[[object, AsyncCursor], T]
+) -> Callable[[object, AsyncCursor], T]:
+    """
+    Wrap a translator in a plain function, as an unrelated decorator might.
+    """
+
+    @wraps(translator)
+    def wrapper(db: object, cursor: AsyncCursor) -> T:
+        return translator(db, cursor)
+
+    return wrapper
+
+
+def evenBars(db: object, cursor: AsyncCursor) -> AsyncIterable[int]:
+    """
+    Plain function returning an async iterable, marked with L{ITERABLE_KEY}.
+    """
+
+    async def evens() -> AsyncIterator[int]:
+        for (bar,) in await cursor.fetchall():
+            if bar % 2 == 0:
+                yield bar
+
+    return evens()
+
+
+setattr(evenBars, ITERABLE_KEY, True)
+
+
+class WrappedAccessPattern(Protocol):
+    @query(
+        sql="select bar from foo order by bar asc",
+        load=wrapped(many(lambda db, bar: bar)),
+    )
+    def allBars(self) -> AsyncIterable[int]:
+        ...
+
+    @query(sql="select {value}", load=wrapped(one(lambda db, x: x)))
+    async def echo(self, value: int) -> int:
+        ...
+
+    @query(sql="select bar from foo order by bar asc", load=evenBars)
+    def evenBars(self) -> AsyncIterable[int]:
+        ...
+
+
 class OtherAccessPattern(Protocol):
     @query(sql="select {value} + 1", load=one(lambda db, x: x))
     async def addOneTo(self, value: int) -> int:
@@ -153,6 +226,95 @@ async def schemaAndData(c: AsyncConnection) -> None:
         await cur.execute(stmt)
 
 
+@dataclass
+class RecordingCursor:
+    """
+    An L{AsyncCursor} with canned results that records which of its methods
+    were called, and which never actually needs to wait.
+    """
+
+    rows: List[Sequence[object]]
+    hasResultSet: bool = True
+    calls: List[str] = field(default_factory=list)
+    operations: List[str] = field(default_factory=list)
+
+    async def description(
+        self,
+    ) -> Optional[Sequence[DBAPIColumnDescription]]:
+        self.calls.append("description")
+        if not self.hasResultSet:
+            return None
+        return [("column", None, None, None, None, None, None)]
+
+    async def rowcount(self) -> int:
+        self.calls.append("rowcount")
+        return len(self.rows)
+
+    async def fetchone(self) -> Optional[Sequence[Any]]:
+        self.calls.append("fetchone")
+        return self.rows.pop(0) if self.rows else None
+
+    async def fetchmany(
+        self, size: Optional[int] = None
+    ) -> Sequence[Sequence[Any]]:
+        self.calls.append(f"fetchmany({size})")
+        assert size is not None
+        result, self.rows[:size] = self.rows[:size], []
+        return result
+
+    async def fetchall(self) -> Sequence[Sequence[Any]]:
+        self.calls.append("fetchall")
+        result, self.rows[:] = self.rows[:], []
+        return result
+
+    async def execute(
+        self,
+        operation: str,
+        parameters: Union[Sequence[Any], Dict[str, Any]] = (),
+    ) -> object:
+        self.calls.append("execute")
+        self.operations.append(operation)
+        return None
+
+    async def close(self) -> None:
+        self.calls.append("close")
+
+
+@dataclass
+class RecordingConnection:
+    """
+    An L{AsyncConnection} which hands out a single L{RecordingCursor}.
+    """
+
+    cur: RecordingCursor
+    paramstyle: str = "qmark"
+
+    async def cursor(self) -> AsyncCursor:
+        return self.cur
+
+    async def rollback(self) -> None:
+        ...
+
+    async def commit(self) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+def completed(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine which never waits for anything, like one that only talks
+    to a L{RecordingCursor}, and return its result.
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        result: T = stop.value
+        return result
+    raise AssertionError("coroutine unexpectedly waited")  # pragma: no cover
+
+
 class AccessTestCase(TestCase):
     """
     Tests for L{accessor} and its associated functions
@@ -175,6 +337,24 @@ class AccessTestCase(TestCase):
         self.assertEqual(result, result2)
         self.assertEqual(result3, [Foo(db, 1, 3), Foo(db, 2, 4)])
 
+    @immediateTest()
+    async def test_manyChunkSize(self, pool: MemoryPool) -> None:
+        """
+        L{many} fetches rows from the cursor in chunks of C{chunkSize}, and
+        yields every row regardless of how many chunks it takes.
+        """
+        async with transaction(pool.connectable) as c:
+            await schemaAndData(c)
+            cur = await c.cursor()
+            await cur.execute("insert into foo (baz) values (5)")
+            db = accessFoo(c)
+            result = [  # pragma: no branch
+                each async for each in db.allFoosOneAtATime()
+            ]
+        self.assertEqual(
+            result, [Foo(db, 1, 3), Foo(db, 2, 4), Foo(db, 3, 5)]
+        )
+
     @immediateTest()
     async def test_defaultParamValue(self, pool: MemoryPool) -> None:
         """
@@ -189,6 +369,35 @@ class AccessTestCase(TestCase):
             result = await db.echoValue()
             self.assertEqual(result, "3")
 
+    @immediateTest()
+    async def test_keywordArguments(self, pool: MemoryPool) -> None:
+        """
+        Query methods accept their parameters as keyword arguments, and raise
+        L{TypeError} for arguments that do not match their signature.
+        """
+        async with transaction(pool.connectable) as c:
+            await schemaAndData(c)
+            db = accessFoo(c)
+            self.assertEqual(await db.echoValue(value=9), "9")
+            self.assertEqual(await db.getFoo(bar=2), Foo(db, 2, 4))
+            with self.assertRaises(TypeError):
+                await db.getFoo(1, bar=1)  # type:ignore[misc]
+            with self.assertRaises(TypeError):
+                await db.getFoo()  # type:ignore[call-arg]
+            with self.assertRaises(TypeError):
+                await db.echoValue(1, 2)  # type:ignore[call-arg]
+
+    def test_methodIdentity(self) -> None:
+        """
+        Generated query methods carry the name, module, and docstring of the
+        protocol methods they implement.
+        """
+        method = accessFoo(RecordingConnection(RecordingCursor([]))).getFoo
+        self.assertEqual(method.__name__, "getFoo")
+        self.assertEqual(method.__qualname__, "FooAccessPattern.getFoo")
+        self.assertEqual(method.__module__, FooAccessPattern.__module__)
+        self.assertEqual(method.__doc__, FooAccessPattern.getFoo.__doc__)
+
     @immediateTest()
     async def test_wrongResultArity(self, pool: MemoryPool) -> None:
         """
@@ -217,6 +426,57 @@ class AccessTestCase(TestCase):
             self.assertIn("point at this definition(many)", tbf2)
             self.assertIn("point at this decoration(many)", tbf2)
 
+    @immediateTest()
+    async def test_loaderWithoutSource(self, pool: MemoryPool) -> None:
+        """
+        A loader whose source code cannot be found, or which has no name, may
+        still be used, and a row of the wrong shape for it still raises
+        L{WrongRowShape}.
+        """
+        unsourced = eval("lambda db, x: x")
+        unnamed = partial(unsourced)
+
+        class Unsourced(Protocol):
+            @query(sql="select {value}", load=one(unsourced))
+            async def echo(self, value: int) -> int:
+                ...
+
+            @query(sql="select {a}, {b}", load=one(unsourced))
+            async def wrongArity(self, a: int, b: int) -> int:
+                ...
+
+            @query(sql="select {a}, {b}", load=one(unnamed))
+            async def wrongArityUnnamed(self, a: int, b: int) -> int:
+                ...
+
+        async with transaction(pool.connectable) as c:
+            db = accessor(Unsourced)(c)
+            self.assertEqual(await db.echo(3), 3)
+            with self.assertRaises(WrongRowShape) as wrs:
+                await db.wrongArity(1, 2)
+            self.assertIn("unknown definition", str(wrs.exception))
+            with self.assertRaises(WrongRowShape) as wrs:
+                await db.wrongArityUnnamed(1, 2)
+            self.assertIn("unknown definition", str(wrs.exception))
+            self.assertIn("functools.partial", str(wrs.exception))
+
+    @immediateTest()
+    async def test_wrappedLoader(self, pool: MemoryPool) -> None:
+        """
+        Translators from L{many} and L{one} keep working when wrapped by a
+        plain function that preserves their attributes with
+        L{functools.wraps}, and a plain function marked with L{ITERABLE_KEY}
+        is iterated rather than awaited.
+        """
+        async with transaction(pool.connectable) as c:
+            await schemaAndData(c)
+            db = accessor(WrappedAccessPattern)(c)
+            result = [each async for each in db.allBars()]  # pragma: no branch
+            self.assertEqual(result, [1, 2])
+            self.assertEqual(await db.echo(5), 5)
+            evens = [each async for each in db.evenBars()]  # pragma: no branch
+            self.assertEqual(evens, [2])
+
     def test_argumentExhaustiveness(self) -> None:
         """
         If a query does not use all of its arguments, or the function does not
@@ -239,6 +499,21 @@ class AccessTestCase(TestCase):
                 async def someMissing(self, bar: str) -> None:
                     ...
 
+    def test_reservedParameterNames(self) -> None:
+        """
+        Parameters whose names would collide with names used internally by
+        the generated query method are rejected during definition.
+        """
+        with self.assertRaises(ParamMismatch) as pm:
+
+            class Clash(Protocol):
+                @query(sql="select {_dbxs_run}", load=one(lambda db, x: x))
+                async def clash(self, _dbxs_run: int) -> int:
+                    ...
+
+        self.assertIn("_dbxs_run", str(pm.exception))
+        self.assertIn("clash", str(pm.exception))
+
     @immediateTest()
     async def test_tooManyResults(self, pool: MemoryPool) -> None:
         """
@@ -256,6 +531,48 @@ class AccessTestCase(TestCase):
             with self.assertRaises(TooManyResults):
                 await db.maybeFooByBaz(3)
 
+    def test_accessorCached(self) -> None:
+        """
+        Calling L{accessor} again with the same protocol returns the same
+        factory rather than building a new one.
+        """
+        self.assertIs(accessor(FooAccessPattern), accessFoo)
+        self.assertIsNot(accessor(OtherAccessPattern), accessFoo)
+
+    def test_paramstyleResolvedOnce(self) -> None:
+        """
+        One accessor class works with connections of any supported
+        paramstyle, which is looked up once, when an accessor is constructed,
+        to pick a subclass whose queries have the right SQL built in.
+        """
+        qmarkCursor = RecordingCursor([(1, 3)])
+        qmarkConnection = RecordingConnection(qmarkCursor)
+        qmarkDB = accessFoo(qmarkConnection)
+        qmarkConnection.paramstyle = "pyformat"
+        completed(qmarkDB.getFoo(1))
+        pyformatCursor = RecordingCursor([(1, 3)])
+        pyformatDB = accessFoo(RecordingConnection(pyformatCursor, "pyformat"))
+        completed(pyformatDB.getFoo(1))
+        self.assertIsNot(type(qmarkDB), type(pyformatDB))
+        self.assertIs(type(qmarkDB).__base__, accessFoo)
+        self.assertIs(type(pyformatDB).__base__, accessFoo)
+        self.assertEqual(
+            qmarkCursor.operations, ["select bar, baz from foo where bar = ?"]
+        )
+        self.assertEqual(
+            pyformatCursor.operations,
+            ["select bar, baz from foo where bar = %s"],
+        )
+
+    def test_weakReferences(self) -> None:
+        """
+        Accessor instances use C{__slots__}, but may still be weakly
+        referenced, as they could be when they were dataclasses.
+        """
+        db = accessFoo(RecordingConnection(RecordingCursor([])))
+        self.assertIs(ref(db)(), db)
+        self.assertFalse(hasattr(db, "__dict__"))
+
     def test_brokenProtocol(self) -> None:
         """
         Using L{accessor} on a protocol with unrelated methods raises a .
@@ -305,6 +622,47 @@ class AccessTestCase(TestCase):
             nothing = await db.newFoo(7)  # type:ignore[func-returns-value]
             self.assertIs(nothing, None)
 
+    def test_statementWithoutResultSetSkipsFetch(self) -> None:
+        """
+        A L{statement} which produces no result set, like most DML, does not
+        try to fetch any rows from its cursor.
+        """
+        cur = RecordingCursor([], hasResultSet=False)
+        db = accessFoo(RecordingConnection(cur))
+        self.assertIs(completed(db.newFoo(7)), None)
+        self.assertEqual(cur.calls, ["execute", "description", "close"])
+
+    def test_statementWithResultSetChecksRows(self) -> None:
+        """
+        A L{statement} which does produce a result set still checks it for
+        rows, and raises L{TooManyResults} if there are any.
+        """
+        cur = RecordingCursor([(1, 3)])
+        db = accessFoo(RecordingConnection(cur))
+        with self.assertRaises(TooManyResults):
+            completed(db.oopsQueryNotStatement())
+        self.assertEqual(
+            cur.calls, ["execute", "description", "fetchone", "close"]
+        )
+
+    def test_oneFetchesAtMostTwoRows(self) -> None:
+        """
+        L{one} and L{maybe} fetch no more than two rows, which is enough to
+        detect too many results, rather than fetching the whole result set.
+        """
+        for name in ["getFoo", "maybeFoo"]:
+            cur = RecordingCursor([(1, 3), (1, 4), (1, 5)])
+            db = accessFoo(RecordingConnection(cur))
+            with self.assertRaises(TooManyResults):
+                completed(getattr(db, name)(1))
+            self.assertEqual(cur.calls, ["execute", "fetchmany(2)", "close"])
+            self.assertEqual(cur.rows, [(1, 5)])
+
+        cur = RecordingCursor([(1, 3)])
+        db = accessFoo(RecordingConnection(cur))
+        self.assertEqual(completed(db.maybeFoo(1)), Foo(db, 1, 3))
+        self.assertEqual(cur.calls, ["execute", "fetchmany(2)", "close"])
+
     @immediateTest()
     async def test_statementWithResultIsError(self, pool: MemoryPool) -> None:
         """